@@ -1,62 +1,186 @@
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, request
+from flask.json.provider import JSONProvider
 import hashlib
+import hmac
+import os
+import secrets
+import sys
 import time
 import threading
-import json
-from datetime import datetime
+import orjson
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import miner
+
+def json_default(obj):
+    """orjson fallback for block contents: frozen transactions and VoteColumns"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return list(obj)
+
+class OrjsonProvider(JSONProvider):
+    """Route Flask's own JSON handling (request bodies, jsonify) through orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=json_default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # ========== BLOCKCHAIN CLASSES ==========
+class VoteColumns:
+    """Mined votes stored column-wise instead of one dict per vote
+    
+    Read-only once built, so a block's memoized hash always matches its votes.
+    """
+    __slots__ = ("voter_ids", "candidate_names", "candidate_ids", "timestamps")
+    
+    def __init__(self, votes):
+        # Each candidate name is stored once per block; votes keep a one-byte index
+        names = {}
+        candidate_ids = bytes([names.setdefault(vote["candidate"], len(names)) for vote in votes])
+        timestamps = array('d', [vote["timestamp"] for vote in votes]).tobytes()
+        set_field = object.__setattr__
+        set_field(self, "voter_ids", tuple(vote["voter_id"] for vote in votes))
+        set_field(self, "candidate_ids", candidate_ids)
+        set_field(self, "candidate_names", tuple(names))
+        set_field(self, "timestamps", memoryview(timestamps).cast('d'))  # Read-only view of the bytes
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("VoteColumns is read-only")
+    
+    def __len__(self):
+        return len(self.voter_ids)
+    
+    def __iter__(self):
+        """Rebuild the original vote dicts, e.g. for hashing and display"""
+        names = self.candidate_names
+        for voter_id, candidate_id, timestamp in zip(self.voter_ids, self.candidate_ids, self.timestamps):
+            yield {
+                "type": "vote",
+                "voter_id": voter_id,
+                "candidate": names[candidate_id],
+                "timestamp": timestamp
+            }
+
+def freeze_transactions(transactions):
+    """Read-only form of a block's transactions, so in-place edits can't outdate its hash"""
+    if isinstance(transactions, VoteColumns):
+        return transactions
+    return tuple(MappingProxyType(dict(t)) if isinstance(t, dict) else t for t in transactions)
+
 class Block:
-    def __init__(self, index, transactions, timestamp, previous_hash):
+    HASHED_FIELDS = ("index", "transactions", "timestamp", "previous_hash", "nonce")
+    __slots__ = HASHED_FIELDS + ("hash", "_transactions_json",
+                                 "_hash_cache", "_prefix_cache", "_dict_cache", "_json_cache")
+    
+    def __init__(self, index, transactions, timestamp, previous_hash, transactions_json=None):
         self.index = index
         self.transactions = transactions
+        self._transactions_json = transactions_json  # Canonical bytes, if already serialized
         self.timestamp = timestamp
         self.previous_hash = previous_hash
         self.nonce = 0
         self.hash = self.calculate_hash()
     
+    def __setattr__(self, name, value):
+        # Reassigning any hashed field invalidates the memoized hash and display form
+        if name in self.HASHED_FIELDS:
+            object.__setattr__(self, "_hash_cache", None)
+            if name != "nonce":
+                object.__setattr__(self, "_prefix_cache", None)
+        if name == "transactions":
+            value = freeze_transactions(value)
+            object.__setattr__(self, "_transactions_json", None)
+        if name in self.HASHED_FIELDS or name == "hash":
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_json_cache", None)
+        object.__setattr__(self, name, value)
+    
+    def header_prefix(self):
+        """Serialize everything except the nonce, which is appended last"""
+        if self._prefix_cache is None:
+            if self._transactions_json is None:
+                self._transactions_json = orjson.dumps(self.transactions, default=json_default,
+                                                       option=orjson.OPT_SORT_KEYS)
+            header = orjson.dumps({
+                "index": self.index,
+                "timestamp": self.timestamp,
+                "previous_hash": self.previous_hash
+            }, option=orjson.OPT_SORT_KEYS)
+            # "transactions" sorts after the other keys, so it is spliced in last
+            self._prefix_cache = header[:-1] + b',"transactions":' + self._transactions_json + b',"nonce":'
+            self._transactions_json = None  # Now held inside the prefix
+        return self._prefix_cache
+    
     def calculate_hash(self):
-        block_string = json.dumps({
-            "index": self.index,
-            "transactions": self.transactions,
-            "timestamp": self.timestamp,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        if self._hash_cache is None:
+            block_string = self.header_prefix() + miner.NONCE_TAIL % self.nonce
+            self._hash_cache = miner.sha256(block_string).hexdigest()
+        return self._hash_cache
     
     def mine_block(self, difficulty):
         """Simple Proof of Work"""
         print(f"⛏️  Mining block {self.index}...")
-        while self.hash[:difficulty] != "0" * difficulty:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        self.nonce, self.hash = miner.mine(self.header_prefix(), difficulty)
+        self._hash_cache = self.hash
+        self.to_json()  # Build the display form once; mined blocks don't change
         print(f"✅ Block {self.index} mined! Hash: {self.hash[:16]}...")
     
     def to_dict(self):
-        return {
-            "index": self.index,
-            "transactions": self.transactions,
-            "timestamp": datetime.fromtimestamp(self.timestamp).strftime('%H:%M:%S'),
-            "previous_hash": self.previous_hash[:16] + "...",
-            "hash": self.hash[:16] + "...",
-            "nonce": self.nonce
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "index": self.index,
+                "transactions": self.transactions,
+                "timestamp": time.strftime('%H:%M:%S', time.localtime(self.timestamp)),
+                "previous_hash": self.previous_hash[:16] + "...",
+                "hash": self.hash[:16] + "...",
+                "nonce": self.nonce
+            }
+        return self._dict_cache
+    
+    def to_json(self):
+        if self._json_cache is None:
+            self._json_cache = orjson.dumps(self.to_dict(), default=json_default)
+        return self._json_cache
+
+# Proof of work tuning. Each extra leading zero is ~16x the hashing per block,
+# and a block's votes stay pending until it is mined
+TARGET_MINE_TIME = float(os.environ.get("VOTING_TARGET_MINE_TIME", "0.1"))  # Seconds per block
+MAX_DIFFICULTY = int(os.environ.get("VOTING_MAX_DIFFICULTY", "4"))  # Most leading zeros required
 
 class Blockchain:
-    def __init__(self):
+    def __init__(self, proof_of_work=True):
         self.chain = []
-        self.difficulty = 2  # Lower difficulty for faster mining
-        self.pending_transactions = []  # Votes waiting to be mined
+        self.proof_of_work = proof_of_work  # False mines every block at difficulty 0, for testing
+        self.difficulty = 2 if proof_of_work else 0  # Starting difficulty, retuned after every block
+        self.min_difficulty = self.difficulty
+        self.max_difficulty = max(MAX_DIFFICULTY, self.difficulty)
+        self.target_mine_time = TARGET_MINE_TIME  # Seconds per block the difficulty is tuned towards
+        self.mine_time_ema = None  # Smoothed mining time at the current difficulty
+        self.pending_transactions = deque()  # Votes waiting to be mined
+        self.pending_transactions_json = deque()  # Canonical bytes of each pending vote
+        self.mining_count = 0  # Votes taken off the pending queues by the running miner
         self.voted_voters = set()  # Track who has voted (including pending)
+        self.pending_voters = set()  # Voters whose votes are not yet mined
+        self.pending_event = threading.Event()  # Set whenever a vote is added
+        self.vote_tally = {}  # candidate: votes, kept current by add_vote
+        self.total_votes = 0
+        self.lock = threading.Lock()  # Guards the chain, pending votes and counters
+        self.mine_lock = threading.Lock()  # Lets only one miner extend the chain at a time
         self.create_genesis_block()
     
     def create_genesis_block(self):
         """Create the first block in the chain"""
         genesis = Block(0, [{"message": "Genesis Block"}], time.time(), "0")
+        started = time.perf_counter()
         genesis.mine_block(self.difficulty)
+        self.adjust_difficulty(time.perf_counter() - started)
         self.chain.append(genesis)
         print("✅ Genesis block created")
     
@@ -65,9 +189,6 @@ class Blockchain:
     
     def add_vote(self, voter_id, candidate):
         """Add a vote to pending transactions"""
-        if voter_id in self.voted_voters:
-            return False, "This voter has already voted"
-        
         transaction = {
             "type": "vote",
             "voter_id": voter_id,
@@ -75,106 +196,169 @@ class Blockchain:
             "timestamp": time.time()
         }
         
-        self.pending_transactions.append(transaction)
-        self.voted_voters.add(voter_id)  # Mark as voted
+        transaction_json = orjson.dumps(transaction, option=orjson.OPT_SORT_KEYS)
+        
+        with self.lock:
+            if voter_id in self.voted_voters:
+                return False, "This voter has already voted"
+            
+            self.pending_transactions.append(transaction)
+            self.pending_transactions_json.append(transaction_json)
+            self.voted_voters.add(voter_id)  # Mark as voted
+            self.pending_voters.add(voter_id)
+            self.vote_tally[candidate] = self.vote_tally.get(candidate, 0) + 1
+            self.total_votes += 1
+        self.pending_event.set()
         print(f"✅ Vote added: {voter_id} -> {candidate}")
         return True, "Vote added successfully"
     
     def mine_pending_transactions(self):
         """Mine all pending votes into a new block"""
-        if not self.pending_transactions:
-            print("ℹ️  No votes to mine")
-            return False, "No votes to mine"
-        
-        print(f"⛏️  Mining {len(self.pending_transactions)} votes...")
-        
-        # Create new block
-        new_block = Block(
-            len(self.chain),
-            self.pending_transactions.copy(),  # Copy to avoid reference issues
-            time.time(),
-            self.get_latest_block().hash
-        )
-        
-        new_block.mine_block(self.difficulty)
-        self.chain.append(new_block)
-        
-        # Clear pending transactions (they're now in the blockchain)
-        mined_count = len(self.pending_transactions)
-        self.pending_transactions = []
+        with self.mine_lock:
+            # Swap in fresh queues so votes keep arriving while this batch is mined
+            with self.lock:
+                batch, self.pending_transactions = self.pending_transactions, deque()
+                batch_json, self.pending_transactions_json = self.pending_transactions_json, deque()
+                self.mining_count = mined_count = len(batch)
+                index = len(self.chain)
+                previous_hash = self.get_latest_block().hash
+            
+            if not mined_count:
+                print("ℹ️  No votes to mine")
+                return False, "No votes to mine"
+            
+            # Build and mine without the state lock so votes and polls aren't blocked
+            print(f"⛏️  Mining {mined_count} votes...")
+            try:
+                new_block = Block(index, VoteColumns(batch), time.time(), previous_hash,
+                                  b"[" + b",".join(batch_json) + b"]")
+                started = time.perf_counter()
+                new_block.mine_block(self.difficulty)
+            except Exception:
+                # Put the batch back in front of any newer votes
+                with self.lock:
+                    self.pending_transactions.extendleft(reversed(batch))
+                    self.pending_transactions_json.extendleft(reversed(batch_json))
+                    self.mining_count = 0
+                raise
+            self.adjust_difficulty(time.perf_counter() - started)
+            
+            with self.lock:
+                self.chain.append(new_block)
+                self.mining_count = 0
+                self.pending_voters.difference_update(new_block.transactions.voter_ids)
         
         print(f"✅ Successfully mined {mined_count} votes into block #{new_block.index}")
         return True, f"Mined {mined_count} votes into block #{new_block.index}"
     
+    def adjust_difficulty(self, mine_time):
+        """Retune difficulty so mining a block takes about target_mine_time, up to max_difficulty"""
+        if not self.proof_of_work:
+            return
+        if self.mine_time_ema is None:
+            self.mine_time_ema = mine_time
+        else:
+            self.mine_time_ema = 0.7 * self.mine_time_ema + 0.3 * mine_time
+        
+        # Each extra leading zero makes mining ~16x slower; the gap between
+        # the two thresholds keeps difficulty from flapping between levels
+        if self.mine_time_ema * 16 < self.target_mine_time and self.difficulty < self.max_difficulty:
+            self.difficulty += 1
+            self.mine_time_ema *= 16
+        elif self.mine_time_ema > self.target_mine_time * 4 and self.difficulty > self.min_difficulty:
+            self.difficulty -= 1
+            self.mine_time_ema /= 16
+        else:
+            return
+        print(f"⚙️  Difficulty adjusted to {self.difficulty}")
+    
     def get_results(self):
-        """Get current vote counts from blockchain"""
-        results = {}
-        
-        # Count votes from mined blocks
-        for block in self.chain[1:]:  # Skip genesis block
-            for transaction in block.transactions:
-                if isinstance(transaction, dict) and 'candidate' in transaction:
-                    candidate = transaction['candidate']
-                    results[candidate] = results.get(candidate, 0) + 1
-        
-        # Also count pending votes
-        for transaction in self.pending_transactions:
-            if isinstance(transaction, dict) and 'candidate' in transaction:
-                candidate = transaction['candidate']
-                results[candidate] = results.get(candidate, 0) + 1
-        
-        return results
+        """Get current vote counts (mined and pending) from the running tally"""
+        with self.lock:
+            return dict(self.vote_tally)
     
-    def get_chain_data(self):
-        """Get blockchain data for display"""
-        return {
-            "blocks": [block.to_dict() for block in self.chain],
-            "pending_count": len(self.pending_transactions),
-            "total_votes": sum(len(block.transactions) for block in self.chain[1:]) + len(self.pending_transactions)
-        }
+    def chain_json_chunks(self):
+        """The chain, its counters and validity as a list of JSON chunks
+        
+        Built eagerly so errors reach the caller; the response then streams
+        each block's cached JSON without joining it into one buffer.
+        """
+        # Snapshot first so blocks mined meanwhile can't skew the counters
+        with self.lock:
+            blocks = self.chain[:]
+            pending_count = self.get_pending_count()
+            total_votes = self.total_votes
+        valid = self.is_chain_valid(blocks)  # Only re-hashes blocks edited since their last hash
+        chunks = [b'{"blocks":[', blocks[0].to_json()]
+        for block in blocks[1:]:
+            chunks += (b",", block.to_json())
+        chunks.append(b'],"pending_count":%d,"total_votes":%d,"valid":%b}' % (
+            pending_count, total_votes, b"true" if valid else b"false"))
+        return chunks
+    
+    def state_tag(self):
+        """Short tag that changes whenever the chain, its validity, pending votes or tally change"""
+        with self.lock:
+            tag = f"{len(self.chain)}-{self.chain[-1].hash[:8]}-{self.get_pending_count()}-{self.total_votes}"
+        # Tampering with an earlier block leaves the counters alone but breaks validity
+        return f"{tag}-{int(self.is_chain_valid())}"
+    
+    def get_pending_count(self):
+        """Count votes not yet in a block, including a batch being mined"""
+        return len(self.pending_transactions) + self.mining_count
     
     def validate_voter(self, voter_id):
         """Check if voter can vote"""
         return voter_id not in self.voted_voters
     
-    def is_chain_valid(self):
-        """Validate blockchain integrity"""
-        for i in range(1, len(self.chain)):
-            current = self.chain[i]
-            previous = self.chain[i-1]
-            
+    def is_chain_valid(self, blocks=None):
+        """Validate blockchain integrity, or of a snapshot of it
+        
+        Transactions are read-only and reassigning a hashed field clears the
+        memoized hash, so only blocks edited since their last hash are re-hashed.
+        """
+        previous = None
+        for current in self.chain[:] if blocks is None else blocks:
             if current.hash != current.calculate_hash():
                 return False
-            if current.previous_hash != previous.hash:
+            if previous is not None and current.previous_hash != previous.hash:
                 return False
+            previous = current
         
         return True
 
 # ========== VOTING SYSTEM ==========
 class VotingSystem:
-    def __init__(self):
-        self.blockchain = Blockchain()
-        self.registered_voters = {}  # voter_id: token
-        self.candidates = ["Alice", "Bob", "Charlie", "Diana", "Edward"]
+    def __init__(self, proof_of_work=True):
+        self.blockchain = Blockchain(proof_of_work)
+        self.registered_voters = {}  # voter_id: token preview shown in the status table
+        self.voters_lock = threading.Lock()  # Guards registered_voters against concurrent registrations
+        self.token_key = secrets.token_bytes(32)  # Tokens are HMACs of voter IDs under this key
+        self.candidates = ("Alice", "Bob", "Charlie", "Diana", "Edward")
+        self._candidate_set = frozenset(self.candidates)
+        self._mine_executor = ThreadPoolExecutor(max_workers=1)  # Runs /mine requests off the request thread
     
     def register_voter(self, voter_id):
         """Register a new voter"""
-        if voter_id in self.registered_voters:
-            return False, "Voter already registered", None
-        
-        # Generate secure token
-        token = hashlib.sha256(f"{voter_id}{time.time()}".encode()).hexdigest()[:12]
-        self.registered_voters[voter_id] = token
+        token = self.voter_token(voter_id)
+        with self.voters_lock:
+            if voter_id in self.registered_voters:
+                return False, "Voter already registered", None
+            self.registered_voters[voter_id] = token[:4] + "****"
         
         print(f"✅ Registered voter: {voter_id} (token: {token})")
         return True, "Registration successful", token
     
+    def voter_token(self, voter_id):
+        """Derive a voter's token; nothing per voter needs storing"""
+        return hmac.new(self.token_key, voter_id.encode(), 'sha256').hexdigest()[:12]
+    
     def verify_voter(self, voter_id, token):
         """Verify voter credentials"""
         if voter_id not in self.registered_voters:
             return False, "Voter not registered"
         
-        if self.registered_voters.get(voter_id) != token:
+        if not hmac.compare_digest(self.voter_token(voter_id).encode(), token.encode()):
             return False, "Invalid token"
         
         return True, "Verification successful"
@@ -187,7 +371,7 @@ class VotingSystem:
             return False, message
         
         # Check candidate
-        if candidate not in self.candidates:
+        if candidate not in self._candidate_set:
             return False, f"Invalid candidate. Choose from: {', '.join(self.candidates)}"
         
         # Add vote to blockchain
@@ -201,33 +385,107 @@ class VotingSystem:
     def get_voter_status(self):
         """Get status of all voters"""
         status = {}
-        for voter_id, token in self.registered_voters.items():
+        pending_voters = self.blockchain.pending_voters
+        # Copy under the lock: a registration resizing the dict would break the loop
+        with self.voters_lock:
+            voters = list(self.registered_voters.items())
+        for voter_id, token_preview in voters:
             has_voted = not self.blockchain.validate_voter(voter_id)
             status[voter_id] = {
                 "registered": True,
                 "has_voted": has_voted,
-                "token_preview": token[:4] + "****",
-                "voted_at": "Pending" if has_voted and voter_id in [t.get('voter_id') for t in self.blockchain.pending_transactions] else "Mined" if has_voted else "Not voted"
+                "token_preview": token_preview,
+                "voted_at": "Pending" if voter_id in pending_voters else "Mined" if has_voted else "Not voted"
             }
         return status
     
+    def dashboard_json_chunks(self, since=None, include_status=False):
+        """The page's poll payload as a list of JSON chunks, built eagerly
+        
+        Counters and results are always included. Blocks from index `since` on
+        (as their cached JSON) with the chain's validity, and the voter status
+        table, only when asked for.
+        """
+        blockchain = self.blockchain
+        with blockchain.lock:
+            blocks = blockchain.chain[:]
+            pending_count = blockchain.get_pending_count()
+            total_votes = blockchain.total_votes
+            results = dict(blockchain.vote_tally)
+        chunks = [b'{"block_count":%d,"genesis_hash":%b,"pending_count":%d,"total_votes":%d,"results":%b' % (
+            len(blocks), orjson.dumps(blocks[0].to_dict()["hash"]), pending_count, total_votes,
+            orjson.dumps(results))]
+        if include_status:
+            chunks.append(b',"status":' + orjson.dumps(self.get_voter_status()))
+        if since is not None:
+            # Only the chain view shows validity; results and status polls skip the check
+            chunks.append(b',"valid":' + (b"true" if blockchain.is_chain_valid(blocks) else b"false"))
+            chunks.append(b',"blocks":[' + b",".join(block.to_json() for block in blocks[max(since, 0):]) + b']')
+        chunks.append(b'}')
+        return chunks
+    
     def mine_votes(self):
         """Mine pending votes"""
         return self.blockchain.mine_pending_transactions()
+    
+    def mine_votes_in_background(self):
+        """Queue mine_votes() on the miner thread and return its future"""
+        future = self._mine_executor.submit(self.mine_votes)
+        future.add_done_callback(report_mining_error)
+        return future
+
+def report_mining_error(future):
+    if future.exception() is not None:
+        print(f"❌ Background mining failed: {future.exception()}")
 
 # ========== INITIALIZE SYSTEM ==========
-voting_system = VotingSystem()
+voting_system = None  # Created by start_voting_system()
+
+# Auto-mining thread: a burst of votes is coalesced into one block. Mining starts
+# once votes stop arriving for MINE_MERGE_INTERVAL (but not before MINE_MIN_DELAY),
+# when a full batch is pending, or when the oldest vote has waited MINE_INTERVAL
+MINE_MIN_DELAY = 2  # Seconds after the first pending vote before mining can start
+MINE_MERGE_INTERVAL = 1  # Quiet period that ends a burst of votes (seconds)
+MINE_INTERVAL = 6  # Longest a pending vote waits before being mined (seconds)
+MINE_BATCH_SIZE = 10  # Pending votes that trigger mining immediately
 
-# Auto-mining thread (mines every 20 seconds)
 def auto_mining_thread():
+    pending_event = voting_system.blockchain.pending_event
     while True:
-        time.sleep(20)
+        pending_event.wait()  # Idle until a vote arrives
+        pending_event.clear()
+        first_vote = last_vote = time.time()
+        deadline = first_vote + MINE_INTERVAL
+        while len(voting_system.blockchain.pending_transactions) < MINE_BATCH_SIZE:
+            quiet_at = max(first_vote + MINE_MIN_DELAY, last_vote + MINE_MERGE_INTERVAL)
+            remaining = min(quiet_at, deadline) - time.time()
+            if remaining <= 0:
+                break
+            if pending_event.wait(remaining):
+                pending_event.clear()
+                last_vote = time.time()
         if voting_system.blockchain.pending_transactions:
-            success, message = voting_system.mine_votes()
+            try:
+                success, message = voting_system.mine_votes()
+            except Exception as e:
+                # The batch is back in the queue; retry after the next mining window
+                print(f"❌ Auto-mining failed: {e}")
+                pending_event.set()
+                continue
             if success:
                 print(f"🤖 Auto-mined: {message}")
 
-threading.Thread(target=auto_mining_thread, daemon=True).start()
+def start_voting_system():
+    """Create the voting system and start auto-mining
+    
+    Not run at import: parallel mining spawns worker processes that re-import
+    this file, and they must not build a chain or start threads of their own.
+    """
+    global voting_system
+    # VOTING_NO_POW=1 skips the nonce search so tests and demos get blocks instantly
+    voting_system = VotingSystem(proof_of_work=os.environ.get("VOTING_NO_POW") != "1")
+    threading.Thread(target=auto_mining_thread, daemon=True).start()
+    return voting_system
 
 # ========== HTML TEMPLATE ==========
 HTML_TEMPLATE = '''
@@ -575,6 +833,23 @@ HTML_TEMPLATE = '''
             margin-right: 10px;
         }
         
+        .toast {
+            position: fixed;
+            right: 20px;
+            bottom: 20px;
+            padding: 15px 20px;
+            border-radius: 8px;
+            border-left: 4px solid;
+            box-shadow: 0 5px 20px rgba(0,0,0,0.2);
+            opacity: 0;
+            transition: opacity 0.3s;
+            pointer-events: none;
+        }
+        
+        .toast.show {
+            opacity: 1;
+        }
+        
         @keyframes spin {
             0% { transform: rotate(0deg); }
             100% { transform: rotate(360deg); }
@@ -673,13 +948,72 @@ HTML_TEMPLATE = '''
             </div>
         </div>
     </div>
+    
+    <!-- Row templates, cloned by the render functions -->
+    <template id="resultTemplate">
+        <div class="result-card">
+            <h3></h3>
+            <div class="votes"></div>
+            <div>votes</div>
+            <div class="percentage" style="margin-top: 10px; font-size: 12px; opacity: 0.8;"></div>
+        </div>
+    </template>
+    
+    <template id="blockTemplate">
+        <div class="block-item">
+            <div class="block-header">
+                <span class="block-index"></span>
+                <span class="status-badge"></span>
+            </div>
+            <p><strong>Hash:</strong> <span class="block-hash"></span></p>
+            <p><strong>Previous Hash:</strong> <span class="block-previous-hash"></span></p>
+            <p><strong>Time:</strong> <span class="block-time"></span></p>
+            <p><strong>Transactions:</strong> <span class="block-transactions"></span></p>
+            <p><strong>Nonce:</strong> <span class="block-nonce"></span></p>
+        </div>
+    </template>
 
     <script>
         let currentSection = 'register';
         
+        // What is already on screen, so refreshes only touch what changed
+        const resultCards = new Map(); // candidate -> result card element
+        let renderedGenesisHash = null;
+        let lastRenderedBlockIndex = -1;
+        
+        // Candidates are fixed for the election, so keep them in localStorage
+        // and only ask the server once the saved copy is older than an hour
+        const CANDIDATES_KEY = 'candidates_v1';
+        const CANDIDATES_TTL = 3600 * 1000;
+        
+        async function fetchCandidates() {
+            try {
+                const saved = JSON.parse(localStorage.getItem(CANDIDATES_KEY));
+                if(saved && Date.now() - saved.saved < CANDIDATES_TTL) return saved.candidates;
+            } catch(error) {
+                // Unreadable or unavailable storage; fall back to the server
+            }
+            
+            const response = await fetch('/candidates');
+            const candidates = await response.json();
+            try {
+                localStorage.setItem(CANDIDATES_KEY, JSON.stringify({saved: Date.now(), candidates}));
+            } catch(error) {
+                // Storage full or disabled; the list just isn't kept
+            }
+            return candidates;
+        }
+        
+        // One request per refresh: counters and results always, plus
+        // ?since=<index> for new blocks or ?status=1 for the voter table
+        async function fetchDashboard(query = '') {
+            const response = await fetch(`/dashboard${query}`);
+            return response.json();
+        }
+        
         // Initialize candidates
-        function loadCandidates() {
-            const candidates = ["Alice", "Bob", "Charlie", "Diana", "Edward"];
+        async function loadCandidates() {
+            const candidates = await fetchCandidates();
             const container = document.getElementById('candidatesList');
             container.innerHTML = '';
             
@@ -829,118 +1163,138 @@ HTML_TEMPLATE = '''
         // Get results
         async function getResults() {
             const resultsDiv = document.getElementById('resultsDisplay');
-            resultsDiv.innerHTML = '<div class="info"><span class="loader"></span> Loading results...</div>';
+            let grid = resultsDiv.querySelector('.results-grid');
+            if(!grid) {
+                resultsDiv.innerHTML = '<div class="info"><span class="loader"></span> Loading results...</div>';
+            }
             
             try {
-                const response = await fetch('/results');
-                const results = await response.json();
+                const chainData = await fetchDashboard();
+                const results = chainData.results;
                 
-                const chainResponse = await fetch('/chain');
-                const chainData = await chainResponse.json();
+                if(!grid) {
+                    resultsDiv.innerHTML = '<div class="results-grid"></div>';
+                    grid = resultsDiv.firstElementChild;
+                    resultCards.clear();
+                }
                 
-                let totalVotes = 0;
-                let html = '<div class="results-grid">';
+                // Drop cards for candidates no longer in the results
+                for(const [candidate, card] of resultCards) {
+                    if(!(candidate in results)) {
+                        card.remove();
+                        resultCards.delete(candidate);
+                    }
+                }
                 
                 // Sort results by vote count (descending)
                 const sortedResults = Object.entries(results).sort((a, b) => b[1] - a[1]);
+                const totalVotes = sortedResults.reduce((sum, [, votes]) => sum + votes, 0);
                 
                 sortedResults.forEach(([candidate, votes]) => {
-                    totalVotes += votes;
-                    const percentage = totalVotes > 0 ? ((votes / totalVotes) * 100).toFixed(1) : 0;
+                    const percentage = totalVotes > 0 ? (votes * 100 / totalVotes).toFixed(1) : 0;
                     
-                    html += `
-                        <div class="result-card">
-                            <h3>${candidate}</h3>
-                            <div class="votes">${votes}</div>
-                            <div>votes</div>
-                            <div style="margin-top: 10px; font-size: 12px; opacity: 0.8;">
-                                ${percentage}%
-                            </div>
-                        </div>
-                    `;
+                    let card = resultCards.get(candidate);
+                    if(!card) {
+                        card = document.getElementById('resultTemplate').content.firstElementChild.cloneNode(true);
+                        card.querySelector('h3').textContent = candidate;
+                        resultCards.set(candidate, card);
+                    }
+                    card.querySelector('.votes').textContent = votes;
+                    card.querySelector('.percentage').textContent = `${percentage}%`;
+                    grid.appendChild(card); // Existing cards are moved, not rebuilt
                 });
                 
-                html += '</div>';
-                
                 // Update statistics
                 document.getElementById('totalVotes').textContent = totalVotes;
-                document.getElementById('blocksMined').textContent = chainData.blocks ? chainData.blocks.length - 1 : 0;
+                document.getElementById('blocksMined').textContent = chainData.block_count - 1;
                 document.getElementById('pendingVotes').textContent = chainData.pending_count || 0;
                 
                 if(totalVotes === 0) {
-                    html = '<div class="info">No votes have been cast yet. Be the first to vote!</div>';
+                    resultsDiv.innerHTML = '<div class="info">No votes have been cast yet. Be the first to vote!</div>';
+                    resultCards.clear();
                 }
-                
-                resultsDiv.innerHTML = html;
             } catch(error) {
                 resultsDiv.innerHTML = `<div class="error">❌ Error loading results: ${error.message}</div>`;
+                resultCards.clear();
             }
         }
         
         // Get blockchain
-        async function getChain() {
+        function renderBlock(block) {
+            const item = document.getElementById('blockTemplate').content.firstElementChild.cloneNode(true);
+            const badge = item.querySelector('.status-badge');
+            badge.classList.add(block.index === 0 ? 'badge-warning' : 'badge-success');
+            badge.textContent = block.index === 0 ? 'Genesis' : 'Vote Block';
+            item.querySelector('.block-index').textContent = `Block #${block.index}`;
+            item.querySelector('.block-hash').textContent = block.hash;
+            item.querySelector('.block-previous-hash').textContent = block.previous_hash;
+            item.querySelector('.block-time').textContent = block.timestamp;
+            item.querySelector('.block-transactions').textContent = block.transactions.length;
+            item.querySelector('.block-nonce').textContent = block.nonce;
+            return item;
+        }
+        
+        // Polls and tab switches can overlap; share the request already in
+        // flight so the same new blocks aren't prepended twice
+        let chainRequest = null;
+        function getChain() {
+            if(!chainRequest) {
+                chainRequest = loadChain().finally(() => { chainRequest = null; });
+            }
+            return chainRequest;
+        }
+        
+        async function loadChain() {
             const chainDiv = document.getElementById('chainDisplay');
-            chainDiv.innerHTML = '<div class="info"><span class="loader"></span> Loading blockchain...</div>';
+            if(lastRenderedBlockIndex < 0) {
+                chainDiv.innerHTML = '<div class="info"><span class="loader"></span> Loading blockchain...</div>';
+            }
             
             try {
-                const response = await fetch('/chain');
-                const data = await response.json();
-                
-                document.getElementById('blockCount').textContent = data.blocks ? data.blocks.length : 0;
+                // Only blocks after the newest one on screen are sent
+                let data = await fetchDashboard(`?since=${lastRenderedBlockIndex + 1}`);
                 
-                const validResponse = await fetch('/validate');
-                const validData = await validResponse.json();
-                document.getElementById('chainValid').innerHTML = validData.valid ? '✅ Yes' : '❌ No';
-                
-                if(!data.blocks || data.blocks.length === 0) {
-                    chainDiv.innerHTML = '<div class="info">No blocks in the chain yet.</div>';
-                    return;
+                // Mined blocks never change; start over only if the chain was replaced
+                if(data.genesis_hash !== renderedGenesisHash || data.block_count <= lastRenderedBlockIndex) {
+                    if(lastRenderedBlockIndex >= 0) {
+                        lastRenderedBlockIndex = -1;
+                        data = await fetchDashboard('?since=0');
+                    }
+                    chainDiv.innerHTML = '';
+                    renderedGenesisHash = data.genesis_hash;
                 }
                 
-                let html = '';
+                document.getElementById('blockCount').textContent = data.block_count;
+                document.getElementById('chainValid').innerHTML = data.valid ? '✅ Yes' : '❌ No';
                 
-                // Display blocks in reverse order (newest first)
-                data.blocks.slice().reverse().forEach(block => {
-                    html += `
-                        <div class="block-item">
-                            <div class="block-header">
-                                <span class="block-index">Block #${block.index}</span>
-                                <span class="status-badge ${block.index === 0 ? 'badge-warning' : 'badge-success'}">
-                                    ${block.index === 0 ? 'Genesis' : 'Vote Block'}
-                                </span>
-                            </div>
-                            <p><strong>Hash:</strong> ${block.hash}</p>
-                            <p><strong>Previous Hash:</strong> ${block.previous_hash}</p>
-                            <p><strong>Time:</strong> ${block.timestamp}</p>
-                            <p><strong>Transactions:</strong> ${block.transactions.length}</p>
-                            <p><strong>Nonce:</strong> ${block.nonce}</p>
-                        </div>
-                    `;
-                });
-                
-                chainDiv.innerHTML = html;
+                // Prepend only the new blocks, newest first
+                const fragment = document.createDocumentFragment();
+                for(let i = data.blocks.length - 1; i >= 0; i--) {
+                    fragment.appendChild(renderBlock(data.blocks[i]));
+                }
+                chainDiv.prepend(fragment);
+                lastRenderedBlockIndex = data.block_count - 1;
             } catch(error) {
                 chainDiv.innerHTML = `<div class="error">❌ Error loading blockchain: ${error.message}</div>`;
+                renderedGenesisHash = null;
+                lastRenderedBlockIndex = -1;
             }
         }
         
         // Get voter status
-        async function getStatus() {
-            const statusDiv = document.getElementById('statusDisplay');
-            statusDiv.innerHTML = '<div class="info"><span class="loader"></span> Loading voter status...</div>';
-            
-            try {
-                const response = await fetch('/status');
-                const status = await response.json();
-                
-                if(Object.keys(status).length === 0) {
-                    statusDiv.innerHTML = '<div class="info">No voters registered yet.</div>';
-                    return;
-                }
-                
-                let html = '<div style="overflow-x: auto;">';
-                html += `
-                    <table style="width: 100%; border-collapse: collapse;">
+        // Voter status is a windowed table: only the rows in view (plus a
+        // buffer) exist in the DOM, and those row elements are reused
+        const STATUS_ROW_HEIGHT = 49; // px, every row is rendered at this height
+        const STATUS_VIEW_HEIGHT = 400; // px, height of the scrolling table area
+        const STATUS_BUFFER_ROWS = 5;
+        let statusRows = []; // [voterId, data] for every registered voter
+        let statusRowPool = [];
+        let statusScrollPending = false;
+        
+        function buildStatusTable(statusDiv) {
+            statusDiv.innerHTML = `
+                <div class="status-scroll" style="max-height: ${STATUS_VIEW_HEIGHT}px; overflow: auto;">
+                    <table style="width: 100%; border-collapse: collapse; white-space: nowrap;">
                         <thead>
                             <tr style="background: #f8f9fa;">
                                 <th style="padding: 12px; text-align: left; border-bottom: 2px solid #dee2e6;">Voter ID</th>
@@ -950,55 +1304,142 @@ HTML_TEMPLATE = '''
                             </tr>
                         </thead>
                         <tbody>
-                `;
+                            <tr class="status-spacer"><td colspan="4" style="padding: 0;"></td></tr>
+                            <tr class="status-spacer"><td colspan="4" style="padding: 0;"></td></tr>
+                        </tbody>
+                    </table>
+                </div>
+            `;
+            statusRowPool = [];
+            
+            // Re-render at most once per frame while scrolling
+            statusDiv.firstElementChild.addEventListener('scroll', () => {
+                if(statusScrollPending) return;
+                statusScrollPending = true;
+                requestAnimationFrame(() => {
+                    statusScrollPending = false;
+                    renderStatusWindow();
+                });
+            });
+        }
+        
+        function createStatusRow() {
+            const row = document.createElement('tr');
+            row.style.cssText = `border-bottom: 1px solid #dee2e6; height: ${STATUS_ROW_HEIGHT}px;`;
+            row.innerHTML = `
+                <td style="padding: 12px;"><strong></strong></td>
+                <td style="padding: 12px;">
+                    <span class="status-badge badge-success">Registered</span>
+                </td>
+                <td style="padding: 12px;"><code></code></td>
+                <td style="padding: 12px;"><span class="status-badge"></span></td>
+            `;
+            return row;
+        }
+        
+        function fillStatusRow(row, voterId, data) {
+            row.querySelector('strong').textContent = voterId;
+            row.querySelector('code').textContent = data.token_preview;
+            const badge = row.cells[3].firstElementChild;
+            badge.className = `status-badge ${data.has_voted ? 'badge-success' : 'badge-warning'}`;
+            badge.textContent = data.has_voted ? `✅ Voted (${data.voted_at})` : '❌ Not Voted';
+        }
+        
+        function renderStatusWindow() {
+            const container = document.querySelector('#statusDisplay .status-scroll');
+            if(!container) return;
+            
+            const tbody = container.querySelector('tbody');
+            const topSpacer = tbody.firstElementChild;
+            const bottomSpacer = tbody.lastElementChild;
+            
+            // Rows in view, widened by a buffer on each side
+            const scrolledRows = Math.floor(Math.max(0, container.scrollTop - tbody.offsetTop) / STATUS_ROW_HEIGHT);
+            const visibleRows = Math.ceil(STATUS_VIEW_HEIGHT / STATUS_ROW_HEIGHT);
+            const first = Math.max(0, scrolledRows - STATUS_BUFFER_ROWS);
+            const last = Math.min(statusRows.length, scrolledRows + visibleRows + STATUS_BUFFER_ROWS);
+            
+            // Grow or shrink the pool, then refill the pooled rows in place
+            while(statusRowPool.length < last - first) {
+                const row = createStatusRow();
+                tbody.insertBefore(row, bottomSpacer);
+                statusRowPool.push(row);
+            }
+            while(statusRowPool.length > last - first) {
+                statusRowPool.pop().remove();
+            }
+            for(let i = first; i < last; i++) {
+                fillStatusRow(statusRowPool[i - first], statusRows[i][0], statusRows[i][1]);
+            }
+            
+            // Spacers stand in for the rows outside the window to keep the scrollbar right
+            topSpacer.style.height = `${first * STATUS_ROW_HEIGHT}px`;
+            topSpacer.style.display = first ? '' : 'none';
+            bottomSpacer.style.height = `${(statusRows.length - last) * STATUS_ROW_HEIGHT}px`;
+            bottomSpacer.style.display = last < statusRows.length ? '' : 'none';
+        }
+        
+        async function getStatus() {
+            const statusDiv = document.getElementById('statusDisplay');
+            if(!statusDiv.querySelector('.status-scroll')) {
+                statusDiv.innerHTML = '<div class="info"><span class="loader"></span> Loading voter status...</div>';
+            }
+            
+            try {
+                const status = (await fetchDashboard('?status=1')).status;
                 
-                for(const [voterId, data] of Object.entries(status)) {
-                    html += `
-                        <tr style="border-bottom: 1px solid #dee2e6;">
-                            <td style="padding: 12px;"><strong>${voterId}</strong></td>
-                            <td style="padding: 12px;">
-                                <span class="status-badge badge-success">Registered</span>
-                            </td>
-                            <td style="padding: 12px;"><code>${data.token_preview}</code></td>
-                            <td style="padding: 12px;">
-                                ${data.has_voted ? 
-                                    `<span class="status-badge badge-success">✅ Voted (${data.voted_at})</span>` : 
-                                    `<span class="status-badge badge-warning">❌ Not Voted</span>`
-                                }
-                            </td>
-                        </tr>
-                    `;
+                statusRows = Object.entries(status);
+                if(statusRows.length === 0) {
+                    statusDiv.innerHTML = '<div class="info">No voters registered yet.</div>';
+                    return;
                 }
                 
-                html += '</tbody></table></div>';
-                statusDiv.innerHTML = html;
+                if(!statusDiv.querySelector('.status-scroll')) {
+                    buildStatusTable(statusDiv);
+                }
+                renderStatusWindow();
             } catch(error) {
                 statusDiv.innerHTML = `<div class="error">❌ Error loading status: ${error.message}</div>`;
             }
         }
         
-        // Mine votes
+        // Short-lived notice in the corner; kind is a message class (info, success, error)
+        let toastTimer = null;
+        function showToast(message, kind) {
+            let toast = document.getElementById('toast');
+            if(!toast) {
+                toast = document.createElement('div');
+                toast.id = 'toast';
+                document.body.appendChild(toast);
+            }
+            toast.className = `toast ${kind} show`;
+            toast.textContent = message;
+            clearTimeout(toastTimer);
+            toastTimer = setTimeout(() => toast.classList.remove('show'), 3000);
+        }
+        
+        // Mine votes; the server mines in the background and the
+        // auto-refresh picks up the new block once it is added
         async function mineNow() {
             try {
                 const response = await fetch('/mine', {method: 'POST'});
                 const data = await response.json();
-                
-                alert(data.message);
-                
-                // Refresh current view
-                if(currentSection === 'results') getResults();
-                if(currentSection === 'blockchain') getChain();
-                if(currentSection === 'status') getStatus();
+                showToast(`⛏️ ${data.message}`, data.success ? 'info' : 'error');
             } catch(error) {
-                alert(`Error: ${error.message}`);
+                showToast(`❌ Error: ${error.message}`, 'error');
             }
         }
         
-        // Auto-refresh
-        setInterval(() => {
-            if(currentSection === 'results') getResults();
-            if(currentSection === 'blockchain') getChain();
-        }, 10000); // Refresh every 10 seconds
+        // Auto-refresh every 10 seconds while the tab is visible; the next
+        // refresh is only scheduled once the current one has finished
+        const dashboardViews = {results: getResults, blockchain: getChain, status: getStatus};
+        async function autoRefresh() {
+            if(document.visibilityState === 'visible' && currentSection in dashboardViews) {
+                await dashboardViews[currentSection](); // Each view reports its own errors
+            }
+            setTimeout(autoRefresh, 10000);
+        }
+        setTimeout(autoRefresh, 10000);
         
         // Initialize
         loadCandidates();
@@ -1011,10 +1452,31 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# The page has no server-side variables, so render it once instead of per request
+INDEX_HTML = app.jinja_env.from_string(HTML_TEMPLATE).render().encode('utf-8')
+INDEX_ETAG = hashlib.sha256(INDEX_HTML).hexdigest()[:16]
+
 # ========== FLASK ROUTES ==========
+def json_response(payload):
+    """Serialize a payload with orjson instead of jsonify"""
+    return app.response_class(orjson.dumps(payload, default=json_default), mimetype='application/json')
+
+def conditional_response(etag, build):
+    """Answer 304 if the client holds this version, otherwise build and tag the response"""
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = build()
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'  # Cache, but revalidate every poll
+    return response
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    response = app.response_class(INDEX_HTML, mimetype='text/html')
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    response.set_etag(INDEX_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/register', methods=['POST'])
 def register():
@@ -1023,17 +1485,17 @@ def register():
         voter_id = data.get('voter_id', '').strip()
         
         if not voter_id:
-            return jsonify({"success": False, "message": "Voter ID is required"})
+            return json_response({"success": False, "message": "Voter ID is required"})
         
         success, message, token = voting_system.register_voter(voter_id)
         
-        return jsonify({
+        return json_response({
             "success": success,
             "message": message,
             "token": token
         })
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return json_response({"success": False, "message": f"Error: {str(e)}"})
 
 @app.route('/vote', methods=['POST'])
 def vote():
@@ -1044,78 +1506,109 @@ def vote():
         candidate = data.get('candidate', '').strip()
         
         if not all([voter_id, token, candidate]):
-            return jsonify({"success": False, "message": "All fields are required"})
+            return json_response({"success": False, "message": "All fields are required"})
         
         success, message = voting_system.cast_vote(voter_id, token, candidate)
         
-        return jsonify({
+        return json_response({
             "success": success,
             "message": message
         })
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return json_response({"success": False, "message": f"Error: {str(e)}"})
+
+@app.route('/candidates')
+def candidates():
+    response = json_response(voting_system.candidates)
+    response.headers['Cache-Control'] = 'public, max-age=3600, immutable'
+    return response
 
 @app.route('/results')
 def results():
     try:
-        results = voting_system.get_results()
-        return jsonify(results)
+        etag = voting_system.blockchain.state_tag()
+        return conditional_response(etag, lambda: json_response(voting_system.get_results()))
     except Exception as e:
-        return jsonify({"error": str(e)})
+        return json_response({"error": str(e)})
 
 @app.route('/chain')
 def chain():
     try:
-        chain_data = voting_system.blockchain.get_chain_data()
-        return jsonify(chain_data)
+        blockchain = voting_system.blockchain
+        return conditional_response(blockchain.state_tag(), lambda: app.response_class(
+            blockchain.chain_json_chunks(), mimetype='application/json'))
     except Exception as e:
-        return jsonify({"error": str(e)})
+        return json_response({"error": str(e)})
 
 @app.route('/status')
 def status():
     try:
-        status_data = voting_system.get_voter_status()
-        return jsonify(status_data)
+        # Registrations change the status table without touching the chain
+        etag = f"{voting_system.blockchain.state_tag()}-{len(voting_system.registered_voters)}"
+        return conditional_response(etag, lambda: json_response(voting_system.get_voter_status()))
+    except Exception as e:
+        return json_response({"error": str(e)})
+
+@app.route('/dashboard')
+def dashboard():
+    try:
+        # Same tag as /status: it covers everything the dashboard contains
+        etag = f"{voting_system.blockchain.state_tag()}-{len(voting_system.registered_voters)}"
+        since = request.args.get('since', type=int)  # First block index the client lacks
+        include_status = request.args.get('status') == '1'
+        return conditional_response(etag, lambda: app.response_class(
+            voting_system.dashboard_json_chunks(since, include_status), mimetype='application/json'))
     except Exception as e:
-        return jsonify({"error": str(e)})
+        return json_response({"error": str(e)})
 
 @app.route('/mine', methods=['POST'])
 def mine():
     try:
-        success, message = voting_system.mine_votes()
-        return jsonify({
-            "success": success,
-            "message": message
+        # Votes already in a block being mined don't count; a new run would find nothing
+        pending_count = len(voting_system.blockchain.pending_transactions)
+        if not pending_count:
+            return json_response({"success": False, "message": "No votes to mine"})
+        
+        # Mining can take a while at high difficulty; the next refresh shows the block
+        voting_system.mine_votes_in_background()
+        response = json_response({
+            "success": True,
+            "message": f"Mining {pending_count} votes in the background"
         })
+        response.status_code = 202
+        return response
     except Exception as e:
-        return jsonify({"success": False, "message": str(e)})
+        return json_response({"success": False, "message": str(e)})
 
 @app.route('/validate')
 def validate():
     try:
         is_valid = voting_system.blockchain.is_chain_valid()
-        return jsonify({"valid": is_valid})
+        return json_response({"valid": is_valid})
     except Exception as e:
-        return jsonify({"valid": False, "error": str(e)})
+        return json_response({"valid": False, "error": str(e)})
 
 @app.route('/test')
 def test():
     """Test endpoint to check if system is working"""
-    return jsonify({
+    return json_response({
         "status": "online",
         "blocks": len(voting_system.blockchain.chain),
-        "pending_votes": len(voting_system.blockchain.pending_transactions),
+        "pending_votes": voting_system.blockchain.get_pending_count(),
         "registered_voters": len(voting_system.registered_voters)
     })
 
 # ========== RUN APPLICATION ==========
 if __name__ == '__main__':
+    start_voting_system()
     print("\n" + "="*60)
     print("🚀 BLOCKCHAIN VOTING SYSTEM")
     print("="*60)
     print("\n✅ System initialized successfully!")
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        print("✅ Free-threaded Python: mining runs in parallel with requests")
     print(f"✅ Candidates: {', '.join(voting_system.candidates)}")
-    print("✅ Auto-mining enabled (every 20 seconds)")
+    print(f"✅ Auto-mining enabled (every {MINE_BATCH_SIZE} votes or {MINE_INTERVAL} seconds)")
     print("\n🌐 Open your browser and navigate to:")
     print("   http://localhost:5000")
     print("\n📋 Quick Start:")
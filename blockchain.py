@@ -1,9 +1,19 @@
-import hashlib
-import json
+import orjson
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
+import miner
+
+def freeze_transactions(transactions) -> tuple:
+    """Read-only form of a block's transactions, so in-place edits can't outdate its hash"""
+    return tuple(MappingProxyType(dict(t)) if isinstance(t, Mapping) else t for t in transactions)
 
 class Block:
+    HASHED_FIELDS = ("index", "transactions", "timestamp", "previous_hash", "nonce")
+    __slots__ = HASHED_FIELDS + ("hash", "_hash_cache", "_prefix_cache", "_dict_cache")
+    
     def __init__(self, index: int, transactions: list, timestamp: float, previous_hash: str):
         self.index = index
         self.transactions = transactions
@@ -12,44 +22,69 @@ class Block:
         self.nonce = 0
         self.hash = self.calculate_hash()
     
+    def __setattr__(self, name, value):
+        # Reassigning any hashed field invalidates the memoized hash and display form
+        if name in self.HASHED_FIELDS:
+            object.__setattr__(self, "_hash_cache", None)
+            if name != "nonce":
+                object.__setattr__(self, "_prefix_cache", None)
+        if name == "transactions":
+            value = freeze_transactions(value)
+        if name in self.HASHED_FIELDS or name == "hash":
+            object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, name, value)
+    
+    def header_prefix(self) -> bytes:
+        """Serialize everything except the nonce, which is appended last"""
+        if self._prefix_cache is None:
+            header = orjson.dumps({
+                "index": self.index,
+                "transactions": self.transactions,
+                "timestamp": self.timestamp,
+                "previous_hash": self.previous_hash
+            }, default=dict, option=orjson.OPT_SORT_KEYS)
+            self._prefix_cache = header[:-1] + b',"nonce":'
+        return self._prefix_cache
+    
     def calculate_hash(self) -> str:
-        block_string = json.dumps({
-            "index": self.index,
-            "transactions": self.transactions,
-            "timestamp": self.timestamp,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        if self._hash_cache is None:
+            block_string = self.header_prefix() + miner.NONCE_TAIL % self.nonce
+            self._hash_cache = miner.sha256(block_string).hexdigest()
+        return self._hash_cache
     
     def mine_block(self, difficulty: int):
         print(f"Mining block {self.index}...")
-        while self.hash[:difficulty] != "0" * difficulty:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        self.nonce, self.hash = miner.mine(self.header_prefix(), difficulty)
+        self._hash_cache = self.hash
         print(f"Block {self.index} mined! Hash: {self.hash[:16]}...")
     
     def to_dict(self) -> dict:
-        return {
-            "index": self.index,
-            "transactions": self.transactions,
-            "timestamp": datetime.fromtimestamp(self.timestamp).strftime('%H:%M:%S'),
-            "previous_hash": self.previous_hash[:16] + "...",
-            "hash": self.hash[:16] + "...",
-            "nonce": self.nonce
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "index": self.index,
+                "transactions": self.transactions,
+                "timestamp": time.strftime('%H:%M:%S', time.localtime(self.timestamp)),
+                "previous_hash": self.previous_hash[:16] + "...",
+                "hash": self.hash[:16] + "...",
+                "nonce": self.nonce
+            }
+        return self._dict_cache
 
 class Blockchain:
-    def __init__(self):
+    def __init__(self, proof_of_work: bool = True):
         self.chain = []
-        self.difficulty = 2  # Reduced for faster mining
-        self.pending_transactions = []
+        self.difficulty = 2 if proof_of_work else 0  # Difficulty 0 accepts the first nonce
+        self.pending_transactions = deque()  # Appends are atomic, so adding needs no lock
+        self._mine_lock = threading.Lock()  # One miner drains the queue at a time
+        self._vote_counts = {}  # candidate: votes in mined blocks
+        self._voter_votes = {}  # voter_id: candidate, from mined blocks
         self.create_genesis_block()
     
     def create_genesis_block(self):
         genesis_block = Block(0, ["Genesis Block"], time.time(), "0")
         genesis_block.mine_block(self.difficulty)
         self.chain.append(genesis_block)
+        self._index_block(genesis_block)
         print("Genesis block created")
     
     def get_latest_block(self):
@@ -62,33 +97,57 @@ class Blockchain:
     
     def mine_pending_transactions(self) -> bool:
         """Mine all pending transactions into a new block"""
-        if not self.pending_transactions:
-            print("No transactions to mine")
-            return False
-        
-        print(f"Mining {len(self.pending_transactions)} votes...")
-        
-        block = Block(
-            len(self.chain),
-            self.pending_transactions[:],  # Copy the list
-            time.time(),
-            self.get_latest_block().hash
-        )
-        
-        block.mine_block(self.difficulty)
-        self.chain.append(block)
-        
-        # Clear pending transactions
-        self.pending_transactions = []
+        with self._mine_lock:
+            # Take only what is queued now; later votes wait for the next block
+            count = len(self.pending_transactions)
+            if not count:
+                print("No transactions to mine")
+                return False
+            
+            popleft = self.pending_transactions.popleft
+            batch = [popleft() for _ in range(count)]
+            
+            print(f"Mining {count} votes...")
+            
+            block = Block(
+                len(self.chain),
+                batch,
+                time.time(),
+                self.get_latest_block().hash
+            )
+            
+            try:
+                block.mine_block(self.difficulty)
+            except Exception:
+                # Put the batch back in front of any newer votes
+                self.pending_transactions.extendleft(reversed(batch))
+                raise
+            self.chain.append(block)
+            self._index_block(block)
         
         print(f"Successfully mined block #{block.index} with {len(block.transactions)} votes")
         return True
     
+    def _index_block(self, block: Block):
+        """Fold a newly mined block into the vote indexes"""
+        for transaction in block.transactions:
+            if isinstance(transaction, Mapping):
+                if 'voter_id' in transaction:
+                    self._voter_votes[transaction['voter_id']] = transaction.get('candidate', 'Unknown')
+                if 'candidate' in transaction:
+                    candidate = transaction['candidate']
+                    self._vote_counts[candidate] = self._vote_counts.get(candidate, 0) + 1
+    
     def is_chain_valid(self) -> bool:
-        """Validate the entire blockchain"""
-        for i in range(1, len(self.chain)):
-            current = self.chain[i]
-            previous = self.chain[i-1]
+        """Validate the entire blockchain
+        
+        Transactions are read-only and reassigning a hashed field clears the
+        memoized hash, so only blocks edited since their last hash are re-hashed.
+        """
+        chain = self.chain[:]
+        for i in range(1, len(chain)):
+            current = chain[i]
+            previous = chain[i-1]
             
             # Recalculate current block's hash
             if current.hash != current.calculate_hash():
@@ -104,24 +163,17 @@ class Blockchain:
     
     def get_voter_votes(self) -> dict:
         """Get all votes from blockchain with voter_id as key"""
-        votes = {}
-        for block in self.chain:
-            for transaction in block.transactions:
-                if isinstance(transaction, dict) and 'voter_id' in transaction:
-                    votes[transaction['voter_id']] = transaction.get('candidate', 'Unknown')
-        return votes
+        return dict(self._voter_votes)
+    
+    @property
+    def voter_votes_view(self) -> dict:
+        """The live voter_id: candidate index, for callers that only read it"""
+        return self._voter_votes
     
     def get_vote_counts(self) -> dict:
         """Count votes per candidate from mined blocks"""
-        counts = {}
-        for block in self.chain:
-            if isinstance(block.transactions, list):
-                for transaction in block.transactions:
-                    if isinstance(transaction, dict) and 'candidate' in transaction:
-                        candidate = transaction['candidate']
-                        counts[candidate] = counts.get(candidate, 0) + 1
-        return counts
+        return dict(self._vote_counts)
     
     def has_voter_voted(self, voter_id: str) -> bool:
         """Check if voter has voted in mined blocks"""
-        return voter_id in self.get_voter_votes()
\ No newline at end of file
+        return voter_id in self._voter_votes
\ No newline at end of file
@@ -0,0 +1,84 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+# hashlib's sha256 is OpenSSL's on supported builds, which dispatches to
+# SHA-NI / AVX2 compression when the CPU has them
+from hashlib import sha256
+
+NONCE_TAIL = b"%d}"  # Appended to Block.header_prefix() to complete the hashed bytes
+STRIDE = 1 << 16  # Nonces claimed by a worker per counter increment
+PARALLEL_MIN_DIFFICULTY = 5  # Below this a single core finds a nonce faster than dispatch
+WORKERS = os.cpu_count() or 1
+
+_pool = None
+_pool_lock = threading.Lock()
+_next_nonce = None
+_found = None
+
+def find_nonce(prefix: bytes, difficulty: int, start_nonce: int = 0, stop_nonce: int = None):
+    """Search nonces in [start_nonce, stop_nonce) until the hash meets the difficulty"""
+    # Hot loop works on locals only: copy the prefix state, hash the tail, compare
+    midstate = sha256(prefix)
+    copy = midstate.copy
+    # Largest digest with `difficulty` leading hex zeros; bytes compare like big-endian ints
+    target = ((1 << (256 - 4 * difficulty)) - 1).to_bytes(32, "big")
+    tail = NONCE_TAIL
+    nonce = start_nonce
+    while nonce != stop_nonce:
+        sha = copy()
+        sha.update(tail % nonce)
+        digest = sha.digest()
+        if digest <= target:
+            return nonce, digest.hex()
+        nonce += 1
+    return None
+
+def _init_worker(next_nonce, found):
+    global _next_nonce, _found
+    _next_nonce = next_nonce
+    _found = found
+
+def _search_stripes(prefix: bytes, difficulty: int):
+    """Claim stripes from the shared counter until any worker finds a nonce"""
+    while not _found.is_set():
+        with _next_nonce.get_lock():
+            start = _next_nonce.value
+            _next_nonce.value = start + STRIDE
+        result = find_nonce(prefix, difficulty, start, start + STRIDE)
+        if result is not None:
+            _found.set()
+            return result
+    return None
+
+def mine(prefix: bytes, difficulty: int) -> tuple:
+    """Find a (nonce, hash) pair, using every core when the difficulty warrants it"""
+    if WORKERS == 1 or difficulty < PARALLEL_MIN_DIFFICULTY:
+        return find_nonce(prefix, difficulty)
+
+    global _pool, _next_nonce, _found
+    with _pool_lock:
+        for attempt in range(2):
+            if _pool is None:
+                # spawn, not fork: forking the threaded server can copy held locks.
+                # Workers re-import the parent's __main__, so callers keep their
+                # startup work behind `if __name__ == '__main__'`
+                context = multiprocessing.get_context("spawn")
+                _next_nonce = context.Value('Q', 0)
+                _found = context.Event()
+                _pool = ProcessPoolExecutor(WORKERS, mp_context=context, initializer=_init_worker,
+                                            initargs=(_next_nonce, _found))
+            _next_nonce.value = 0
+            _found.clear()
+            try:
+                futures = [_pool.submit(_search_stripes, prefix, difficulty) for _ in range(WORKERS)]
+                results = [future.result() for future in futures]
+                break
+            except BrokenProcessPool:
+                # A worker died; a broken pool never recovers, so retry once on a fresh one
+                _pool.shutdown(wait=False, cancel_futures=True)
+                _pool = None
+                if attempt:
+                    raise
+    return min(result for result in results if result is not None)
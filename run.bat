@@ -2,7 +2,7 @@
 echo Starting Blockchain Voting System...
 echo.
 echo Installing dependencies...
-pip install flask
+pip install flask orjson
 
 echo.
 echo Starting application...
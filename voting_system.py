@@ -1,29 +1,36 @@
-import hashlib
+import secrets
+import threading
 import time
 from blockchain import Blockchain
 
 class VotingSystem:
-    def __init__(self):
-        self.blockchain = Blockchain()
+    def __init__(self, proof_of_work: bool = True):
+        self.blockchain = Blockchain(proof_of_work)
         self.voters = {}  # voter_id: {'token': token, 'voted': False}
-        self.candidates = ["Alice", "Bob", "Charlie", "Diana"]
+        self.candidates = ("Alice", "Bob", "Charlie", "Diana")
+        self._candidate_set = frozenset(self.candidates)
         self.pending_votes = {}  # Track votes that are pending (not yet mined)
+        self._lock = threading.Lock()  # Votes and mine_votes() touch the same pending state
     
     def register_voter(self, voter_id: str) -> str:
         """Register a new voter and return their token"""
         if voter_id in self.voters:
             raise Exception("Voter already registered")
         
-        # Create unique token
-        token = hashlib.sha256(f"{voter_id}{time.time()}".encode()).hexdigest()[:12]
-        self.voters[voter_id] = {'token': token, 'voted': False}
+        # Create unique token (random, so it can't be derived from the ID and clock)
+        token = secrets.token_hex(6)
+        # Seed the flag from the chain once; cast_vote then relies on it alone
+        self.voters[voter_id] = {'token': token, 'voted': self.blockchain.has_voter_voted(voter_id)}
         
         print(f"Voter {voter_id} registered with token: {token}")
         return token
     
     def verify_token(self, voter_id: str, token: str) -> bool:
         """Verify if token is valid for voter"""
-        return voter_id in self.voters and self.voters[voter_id]['token'] == token
+        if voter_id not in self.voters or not isinstance(token, str):
+            return False
+        # compare_digest only takes ASCII str, so compare the encoded bytes
+        return secrets.compare_digest(self.voters[voter_id]['token'].encode(), token.encode())
     
     def cast_vote(self, voter_id: str, token: str, candidate: str) -> str:
         """Cast a vote if valid"""
@@ -36,41 +43,43 @@ class VotingSystem:
             return "Invalid token"
         
         # Check if candidate is valid
-        if candidate not in self.candidates:
+        if candidate not in self._candidate_set:
             return "Invalid candidate"
         
-        # Check if voter has already voted (in blockchain OR pending)
-        has_voted_in_blockchain = self.blockchain.has_voter_voted(voter_id)
-        has_voted_pending = voter_id in self.pending_votes
-        
-        if self.voters[voter_id]['voted'] or has_voted_in_blockchain or has_voted_pending:
-            return "Voter has already cast a vote"
-        
-        # Create vote transaction
-        vote_transaction = {
-            "type": "vote",
-            "voter_id": voter_id,
-            "candidate": candidate,
-            "timestamp": time.time()
-        }
-        
-        # Add to pending votes
-        self.pending_votes[voter_id] = vote_transaction
-        
-        # Add to blockchain pending transactions
-        self.blockchain.add_transaction(vote_transaction)
-        
-        # Mark voter as voted
-        self.voters[voter_id]['voted'] = True
+        with self._lock:
+            # Check if voter has already voted (the flag covers mined votes too)
+            if self.voters[voter_id]['voted'] or voter_id in self.pending_votes:
+                return "Voter has already cast a vote"
+            
+            # Create vote transaction
+            vote_transaction = {
+                "type": "vote",
+                "voter_id": voter_id,
+                "candidate": candidate,
+                "timestamp": time.time()
+            }
+            
+            # Add to pending votes
+            self.pending_votes[voter_id] = vote_transaction
+            
+            # Add to blockchain pending transactions
+            self.blockchain.add_transaction(vote_transaction)
+            
+            # Mark voter as voted
+            self.voters[voter_id]['voted'] = True
         
         return "Vote cast successfully! It will be added to blockchain when mined."
     
     def mine_votes(self):
         """Mine pending votes into blockchain"""
+        # Proof of work runs without self._lock so votes keep being accepted;
+        # the blockchain drains its own queue under its mine lock
         success = self.blockchain.mine_pending_transactions()
         if success:
-            # Clear pending votes after mining
-            self.pending_votes = {}
+            with self._lock:
+                # Votes cast while the block was mined stay pending
+                self.pending_votes = {voter_id: vote for voter_id, vote in self.pending_votes.items()
+                                      if not self.blockchain.has_voter_voted(voter_id)}
             return "Votes mined successfully!"
         return "No votes to mine"
     
@@ -81,7 +90,7 @@ class VotingSystem:
     def get_voter_status(self) -> dict:
         """Get voter registration and voting status"""
         status = {}
-        votes = self.blockchain.get_voter_votes()
+        votes = self.blockchain.voter_votes_view  # Only read, so no copy
         
         for voter_id, data in self.voters.items():
             status[voter_id] = {